@@ -4,15 +4,65 @@ Orchestrates child agents based on user intent
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict, List, Optional
 from .weather_agent import WeatherAgent
 from .places_agent import PlacesAgent
 
 
+_WORD_RE = re.compile(r"[A-Za-z]+(?:['-][A-Za-z]+)*")
+_GAZETTEER_MAX_WORDS = 4
+
+
+def _load_gazetteer() -> frozenset:
+    """
+    Load known place names, normalized to lowercase space-joined words
+    
+    Returns:
+        Frozenset of normalized place names
+    """
+    path = Path(__file__).parent / 'gazetteer.txt'
+    names = set()
+    for line in path.read_text(encoding='utf-8').splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            names.add(' '.join(_WORD_RE.findall(line.lower())))
+    return frozenset(names)
+
+
+_GAZETTEER = _load_gazetteer()
+
 
 class TourismAgent:
     """Parent agent that orchestrates weather and places agents"""
     
+    # Common patterns: "going to X", "visit X", "in X", "at X"
+    _LOC_PATTERNS = [
+        re.compile(r'(?:going to|visit|trip to|travel to)\s+([A-Z][a-zA-Z\s]+?)(?:[,.]|$|\s+(?:let|what|and))'),
+        re.compile(r'(?:in|at)\s+([A-Z][a-zA-Z\s]+?)(?:[,.]|$|\s+(?:let|what|and))'),
+    ]
+    
+    # Keyword patterns for weather intent. Open-ended stems (\w*) keep the
+    # inflections substring matching used to catch (rainfall, forecasts,
+    # colder); short words are spelled out so "temperate" or "hotel" don't match.
+    _WEATHER_KEYWORDS = (
+        r'weather\w*', r'temperatures?', r'temps?', r'rain\w*', r'forecast\w*',
+        r'hot(?:ter|test)?', r'cold\w*', r'climates?'
+    )
+    
+    # Keyword patterns for places intent
+    _PLACES_KEYWORDS = (
+        r'visit\w*', r'places?', r'attractions?', r'see(?:ing|n)?', r'sightseeing',
+        r'sights?', r'tour\w*', r'destinations?', r'spots?', r'things to do'
+    )
+    
+    # Single whole-word alternation; the named group tells which intent matched
+    _INTENT_RE = re.compile(
+        r'\b(?:(?P<weather>' + '|'.join(_WEATHER_KEYWORDS) + ')'
+        r'|(?P<places>' + '|'.join(_PLACES_KEYWORDS) + r'))\b'
+    )
+    
     def __init__(self):
         self.weather_agent = WeatherAgent()
         self.places_agent = PlacesAgent()
@@ -29,20 +79,10 @@ class TourismAgent:
         """
         user_input_lower = user_input.lower()
         
-        # Keywords for weather intent
-        weather_keywords = [
-            'weather', 'temperature', 'rain', 'forecast', 
-            'hot', 'cold', 'climate', 'temp'
-        ]
-        
-        # Keywords for places intent
-        places_keywords = [
-            'visit', 'places', 'attractions', 'see', 'tour',
-            'tourist', 'sights', 'destination', 'spots', 'things to do'
-        ]
+        intents = {match.lastgroup for match in self._INTENT_RE.finditer(user_input_lower)}
         
-        wants_weather = any(keyword in user_input_lower for keyword in weather_keywords)
-        wants_places = any(keyword in user_input_lower for keyword in places_keywords)
+        wants_weather = 'weather' in intents
+        wants_places = 'places' in intents
         
         # If no specific keywords, assume they want places (trip planning)
         if not wants_weather and not wants_places:
@@ -67,21 +107,27 @@ class TourismAgent:
         if len(user_input.strip()) < 5:
             return None
             
-        # Common patterns: "going to X", "visit X", "in X", "to X"
-        patterns = [
-            r'(?:going to|visit|trip to|travel to)\s+([A-Z][a-zA-Z\s]+?)(?:\,|\.|$|\s+let|\s+what|\s+and)',
-            r'(?:in|at)\s+([A-Z][a-zA-Z\s]+?)(?:\,|\.|$|\s+let|\s+what|\s+and)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, user_input)
+        for pattern in self._LOC_PATTERNS:
+            match = pattern.search(user_input)
             if match:
                 location = match.group(1).strip()
                 # Skip if location is too short (likely not a real place)
                 if len(location) > 2:
                     return location
         
-        # If no pattern matches, look for capitalized words (likely place names)
+        # If no pattern matches, look for the longest known place name
+        words = _WORD_RE.findall(user_input)
+        lowered = [word.lower() for word in words]
+        for i in range(len(words)):
+            for n in range(min(_GAZETTEER_MAX_WORDS, len(words) - i), 0, -1):
+                # Single words must be capitalized so everyday words that are
+                # also place names ("turkey", "chile") aren't taken as places
+                if n == 1 and not words[i][0].isupper():
+                    continue
+                if ' '.join(lowered[i:i + n]) in _GAZETTEER:
+                    return ' '.join(words[i:i + n])
+        
+        # Otherwise look for capitalized words (likely place names)
         words = user_input.split()
         for i, word in enumerate(words):
             if word[0].isupper() and word.lower() not in ['i', 'i\'m', 'let\'s', 'what', 'is', 'the', 'and']:
@@ -144,17 +190,33 @@ class TourismAgent:
                 'places': None
             }
         
-        # Query weather agent if needed
-        if intent['weather']:
+        weather_data = None
+        places_data = None
+        
+        if intent['weather'] and intent['places']:
+            # Both lookups are independent network calls, so run them in parallel
+            # (a pool per call, since the agent is shared by every session)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                weather_future = executor.submit(
+                    self.weather_agent.get_weather, coords['lat'], coords['lon']
+                )
+                places_future = executor.submit(
+                    self.places_agent.get_tourist_attractions, coords['lat'], coords['lon']
+                )
+                weather_data = weather_future.result()
+                places_data = places_future.result()
+        elif intent['weather']:
             weather_data = self.weather_agent.get_weather(coords['lat'], coords['lon'])
+        elif intent['places']:
+            places_data = self.places_agent.get_tourist_attractions(coords['lat'], coords['lon'])
+        
+        if weather_data is not None:
             if weather_data['success']:
                 results['weather'] = weather_data
             else:
                 results['error'] = weather_data.get('error', 'Failed to fetch weather data')
         
-        # Query places agent if needed
-        if intent['places']:
-            places_data = self.places_agent.get_tourist_attractions(coords['lat'], coords['lon'])
+        if places_data is not None:
             if places_data['success']:
                 results['places'] = places_data
             else:
@@ -5,7 +5,10 @@ Places Agent - Fetches tourist attractions using Nominatim and Overpass APIs
 import requests
 from typing import Dict, List, Optional
 from utils.api_helpers import make_api_request
+import threading
 import time
+from collections import OrderedDict
+from itertools import islice
 
 
 class PlacesAgent:
@@ -13,6 +16,20 @@ class PlacesAgent:
     
     NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
     OVERPASS_URL = "https://overpass-api.de/api/interpreter"
+    GEOCODE_CACHE_TTL = 24 * 60 * 60  # seconds
+    GEOCODE_CACHE_SIZE = 512
+    ATTRACTIONS_CACHE_TTL = 60 * 60  # seconds
+    ATTRACTIONS_CACHE_SIZE = 256
+    
+    def __init__(self):
+        # The agent is shared between Streamlit sessions, so every cache
+        # is guarded by its own lock
+        # Normalized place name -> (timestamp, coordinates or None)
+        self._geocode_cache: Dict[str, tuple] = {}
+        self._geocode_cache_lock = threading.Lock()
+        # (rounded lat, rounded lon, radius, limit) -> (timestamp, result)
+        self._attr_cache: OrderedDict = OrderedDict()
+        self._attr_cache_lock = threading.Lock()
     
     def get_coordinates(self, place_name: str) -> Optional[Dict[str, float]]:
         """
@@ -24,6 +41,12 @@ class PlacesAgent:
         Returns:
             Dictionary with lat/lon or None if not found
         """
+        key = place_name.strip().lower()
+        with self._geocode_cache_lock:
+            cached = self._geocode_cache.get(key)
+        if cached and time.time() - cached[0] < self.GEOCODE_CACHE_TTL:
+            return cached[1]
+        
         params = {
             'q': place_name,
             'format': 'json',
@@ -36,18 +59,26 @@ class PlacesAgent:
         
         response = make_api_request(self.NOMINATIM_URL, params, headers)
         
-        if not response['success'] or not response['data']:
+        # Don't cache failed requests so transient errors are retried
+        if not response['success']:
             return None
         
         data = response['data']
+        coords = None
         
-        if len(data) > 0:
-            return {
+        if data and len(data) > 0:
+            coords = {
                 'lat': float(data[0]['lat']),
                 'lon': float(data[0]['lon'])
             }
         
-        return None
+        # Evict the oldest entry once the cache is full
+        with self._geocode_cache_lock:
+            if key not in self._geocode_cache and len(self._geocode_cache) >= self.GEOCODE_CACHE_SIZE:
+                self._geocode_cache.pop(next(iter(self._geocode_cache)))
+            self._geocode_cache[key] = (time.time(), coords)
+        
+        return coords
     
     def get_tourist_attractions(self, latitude: float, longitude: float, 
                                radius: int = 5000, limit: int = 5) -> Dict:
@@ -63,28 +94,71 @@ class PlacesAgent:
         Returns:
             Dictionary with attractions or error
         """
-        # Overpass QL query for tourist attractions
+        # Round to ~100m so nearby queries share a cached result
+        key = (round(latitude, 3), round(longitude, 3), radius, limit)
+        with self._attr_cache_lock:
+            cached = self._attr_cache.get(key)
+            if cached and time.time() - cached[0] < self.ATTRACTIONS_CACHE_TTL:
+                self._attr_cache.move_to_end(key)
+                return cached[1]
+        
+        result = self._fetch_tourist_attractions(latitude, longitude, radius, limit)
+        
+        # Only cache successful lookups so transient failures are retried
+        if result['success']:
+            with self._attr_cache_lock:
+                self._attr_cache[key] = (time.time(), result)
+                self._attr_cache.move_to_end(key)
+                if len(self._attr_cache) > self.ATTRACTIONS_CACHE_SIZE:
+                    self._attr_cache.popitem(last=False)
+        
+        return result
+    
+    def _fetch_tourist_attractions(self, latitude: float, longitude: float,
+                                   radius: int, limit: int) -> Dict:
+        """
+        Query Overpass for tourist attractions near coordinates
+        
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            radius: Search radius in meters
+            limit: Maximum number of results
+            
+        Returns:
+            Dictionary with attractions or error
+        """
+        # Overpass QL query for tourist attractions. Only elements that have
+        # a name or a description are returned, so the server does the
+        # filtering and every element in the response is usable.
+        labelled = '[~"^(name|description)$"~"."]'
         query = f"""
-        [out:json];
+        [out:json][timeout:25];
         (
-          node["tourism"~"attraction|museum|artwork|viewpoint|zoo|theme_park"]
+          node["tourism"~"attraction|museum|artwork|viewpoint|zoo|theme_park"]{labelled}
             (around:{radius},{latitude},{longitude});
-          way["tourism"~"attraction|museum|artwork|viewpoint|zoo|theme_park"]
+          way["tourism"~"attraction|museum|artwork|viewpoint|zoo|theme_park"]{labelled}
             (around:{radius},{latitude},{longitude});
-          node["historic"~"monument|memorial|castle|ruins"]
+          node["historic"~"monument|memorial|castle|ruins"]{labelled}
             (around:{radius},{latitude},{longitude});
-          way["historic"~"monument|memorial|castle|ruins"]
+          way["historic"~"monument|memorial|castle|ruins"]{labelled}
             (around:{radius},{latitude},{longitude});
-          node["amenity"="place_of_worship"]
+          node["amenity"="place_of_worship"]{labelled}
             (around:{radius},{latitude},{longitude});
-          way["amenity"="place_of_worship"]
+          way["amenity"="place_of_worship"]{labelled}
             (around:{radius},{latitude},{longitude});
         );
-        out center {limit};
+        out center qt {limit};
         """
         
+        headers = {
+            'Accept-Encoding': 'gzip, deflate',
+            'User-Agent': 'TourismAIAgent/1.0'
+        }
+        
         response = make_api_request(
             self.OVERPASS_URL,
+            headers=headers,
             data={'data': query},
             method='POST'
         )
@@ -105,50 +179,60 @@ class PlacesAgent:
                 'message': 'No tourist attractions found in this area'
             }
         
-        # Parse and format attractions
-        attractions = []
-        for element in elements[:limit * 2]:  # Get more to filter unnamed ones
-            tags = element.get('tags', {})
-            
-            # Skip if no name and no useful description
-            name = tags.get('name', '')
-            description = tags.get('description', '')
-            
-            # Skip unnamed attractions unless they have a description
-            if not name and not description:
-                continue
-            
-            # Get coordinates (for ways, use center)
-            if 'center' in element:
-                lat = element['center']['lat']
-                lon = element['center']['lon']
-            else:
-                lat = element.get('lat')
-                lon = element.get('lon')
-            
-            # Create a better name if unnamed
-            if not name:
-                attraction_type = tags.get('tourism') or tags.get('historic') or tags.get('amenity', 'attraction')
-                name = f"{attraction_type.replace('_', ' ').title()}"
-            
-            attraction = {
-                'name': name,
-                'type': tags.get('tourism') or tags.get('historic') or tags.get('amenity', 'attraction'),
-                'latitude': lat,
-                'longitude': lon,
-                'address': tags.get('addr:full') or tags.get('addr:street', ''),
-                'website': tags.get('website', ''),
-                'description': description
-            }
-            
-            attractions.append(attraction)
-            
-            # Stop once we have enough named attractions
-            if len(attractions) >= limit:
-                break
+        # Parse and format attractions, skipping any without a name or description
+        attractions = [
+            self._parse_attraction(element)
+            for element in islice(filter(self._has_label, elements), limit)
+        ]
         
         return {
             'success': True,
             'attractions': attractions,
             'count': len(attractions)
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def _has_label(element: Dict) -> bool:
+        """
+        Check whether an Overpass element has a name or description
+        
+        Args:
+            element: Overpass element
+            
+        Returns:
+            True if the element can be shown to the user
+        """
+        tags = element.get('tags', {})
+        return bool(tags.get('name') or tags.get('description'))
+    
+    @staticmethod
+    def _parse_attraction(element: Dict) -> Dict:
+        """
+        Convert an Overpass element into an attraction dictionary
+        
+        Args:
+            element: Overpass element with a name or description
+            
+        Returns:
+            Attraction dictionary
+        """
+        tags_get = element.get('tags', {}).get
+        attraction_type = tags_get('tourism') or tags_get('historic') or tags_get('amenity') or 'attraction'
+        
+        # Get coordinates (for ways, use center)
+        center = element.get('center')
+        if center:
+            lat, lon = center['lat'], center['lon']
+        else:
+            lat, lon = element.get('lat'), element.get('lon')
+        
+        return {
+            # Create a better name if unnamed
+            'name': tags_get('name') or attraction_type.replace('_', ' ').title(),
+            'type': attraction_type,
+            'latitude': lat,
+            'longitude': lon,
+            'address': tags_get('addr:full') or tags_get('addr:street', ''),
+            'website': tags_get('website', ''),
+            'description': tags_get('description', '')
+        }
@@ -3,19 +3,87 @@ Weather Agent - Fetches weather data from Open-Meteo API
 """
 
 import requests
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from utils.api_helpers import make_api_request
+import threading
+import time
+
+
+# WMO weather code -> description, built once and indexed by code (0-99)
+_WMO_CODES = {
+    0: "Clear sky",
+    1: "Mainly clear",
+    2: "Partly cloudy",
+    3: "Overcast",
+    45: "Foggy",
+    48: "Depositing rime fog",
+    51: "Light drizzle",
+    53: "Moderate drizzle",
+    55: "Dense drizzle",
+    61: "Slight rain",
+    63: "Moderate rain",
+    65: "Heavy rain",
+    71: "Slight snow",
+    73: "Moderate snow",
+    75: "Heavy snow",
+    77: "Snow grains",
+    80: "Slight rain showers",
+    81: "Moderate rain showers",
+    82: "Violent rain showers",
+    85: "Slight snow showers",
+    86: "Heavy snow showers",
+    95: "Thunderstorm",
+    96: "Thunderstorm with slight hail",
+    99: "Thunderstorm with heavy hail"
+}
+_WMO_DESCRIPTIONS = tuple(_WMO_CODES.get(code, "Unknown") for code in range(100))
 
 
 class WeatherAgent:
     """Agent responsible for fetching weather information"""
     
     BASE_URL = "https://api.open-meteo.com/v1/forecast"
+    WEATHER_CACHE_TTL = 10 * 60  # seconds
+    WEATHER_CACHE_SIZE = 128
+    
+    def __init__(self):
+        # (latitude, longitude) -> (timestamp, weather result)
+        self._weather_cache: Dict[tuple, tuple] = {}
+        # The agent is shared between Streamlit sessions, so guard the cache
+        self._weather_cache_lock = threading.Lock()
     
     def get_weather(self, latitude: float, longitude: float) -> Dict:
         """
         Get current weather and forecast for a location
         
+        Args:
+            latitude: Location latitude
+            longitude: Location longitude
+            
+        Returns:
+            Dictionary with weather data or error
+        """
+        key = (latitude, longitude)
+        with self._weather_cache_lock:
+            cached = self._weather_cache.get(key)
+        if cached and time.time() - cached[0] < self.WEATHER_CACHE_TTL:
+            return cached[1]
+        
+        result = self._fetch_weather(latitude, longitude)
+        
+        # Only cache successful lookups so transient failures are retried
+        if result['success']:
+            with self._weather_cache_lock:
+                if key not in self._weather_cache and len(self._weather_cache) >= self.WEATHER_CACHE_SIZE:
+                    self._weather_cache.pop(next(iter(self._weather_cache)))
+                self._weather_cache[key] = (time.time(), result)
+        
+        return result
+    
+    def _fetch_weather(self, latitude: float, longitude: float) -> Dict:
+        """
+        Query Open-Meteo for current weather and forecast
+        
         Args:
             latitude: Location latitude
             longitude: Location longitude
@@ -27,7 +95,7 @@ class WeatherAgent:
             'latitude': latitude,
             'longitude': longitude,
             'current': 'temperature_2m,relative_humidity_2m,precipitation,weather_code',
-            'daily': 'temperature_2m_max,temperature_2m_min,precipitation_probability_max',
+            'daily': 'weather_code,temperature_2m_max,temperature_2m_min,precipitation_probability_max',
             'timezone': 'auto',
             'forecast_days': 3
         }
@@ -58,6 +126,7 @@ class WeatherAgent:
                 'max_temps': daily.get('temperature_2m_max', []),
                 'min_temps': daily.get('temperature_2m_min', []),
                 'precipitation_probability': daily.get('precipitation_probability_max', []),
+                'weather_codes': daily.get('weather_code', []),
                 'dates': daily.get('time', [])
             },
             'timezone': data.get('timezone', 'UTC')
@@ -74,31 +143,23 @@ class WeatherAgent:
         Returns:
             Weather description string
         """
-        weather_codes = {
-            0: "Clear sky",
-            1: "Mainly clear",
-            2: "Partly cloudy",
-            3: "Overcast",
-            45: "Foggy",
-            48: "Depositing rime fog",
-            51: "Light drizzle",
-            53: "Moderate drizzle",
-            55: "Dense drizzle",
-            61: "Slight rain",
-            63: "Moderate rain",
-            65: "Heavy rain",
-            71: "Slight snow",
-            73: "Moderate snow",
-            75: "Heavy snow",
-            77: "Snow grains",
-            80: "Slight rain showers",
-            81: "Moderate rain showers",
-            82: "Violent rain showers",
-            85: "Slight snow showers",
-            86: "Heavy snow showers",
-            95: "Thunderstorm",
-            96: "Thunderstorm with slight hail",
-            99: "Thunderstorm with heavy hail"
-        }
+        if isinstance(weather_code, int) and 0 <= weather_code < len(_WMO_DESCRIPTIONS):
+            return _WMO_DESCRIPTIONS[weather_code]
+        return "Unknown"
+    
+    @staticmethod
+    def get_weather_descriptions(weather_codes: List[int]) -> List[str]:
+        """
+        Convert a list of weather codes to human-readable descriptions
         
-        return weather_codes.get(weather_code, "Unknown")
\ No newline at end of file
+        Args:
+            weather_codes: WMO weather codes
+            
+        Returns:
+            List of weather description strings
+        """
+        size = len(_WMO_DESCRIPTIONS)
+        return [
+            _WMO_DESCRIPTIONS[code] if isinstance(code, int) and 0 <= code < size else "Unknown"
+            for code in weather_codes
+        ]
@@ -11,10 +11,6 @@ from pathlib import Path
 root_path = Path(__file__).parent.parent
 sys.path.insert(0, str(root_path))
 
-from agents.parent_agent import TourismAgent
-from agents.weather_agent import WeatherAgent
-from utils.api_helpers import format_temperature, format_percentage
-
 # Page configuration
 st.set_page_config(
     page_title="Tourism AI Agent",
@@ -24,52 +20,27 @@ st.set_page_config(
 )
 
 # Custom CSS for better styling
-st.markdown("""
-    <style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        margin-bottom: 0.5rem;
-    }
-    .sub-header {
-        text-align: center;
-        color: #666;
-        margin-bottom: 2rem;
-    }
-    .weather-card {
-        background-color: #f0f8ff;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 5px solid #1f77b4;
-    }
-    .places-card {
-        background-color: #f0fff0;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 5px solid #2ecc71;
-        margin-bottom: 1rem;
-    }
-    .attraction-item {
-        padding: 1rem;
-        margin: 0.5rem 0;
-        background-color: white;
-        border-radius: 8px;
-        border: 1px solid #e0e0e0;
-    }
-    .error-card {
-        background-color: #fff5f5;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 5px solid #e74c3c;
-    }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css() -> str:
+    """Read the stylesheet once per process and wrap it for injection"""
+    css = (Path(__file__).parent / "style.css").read_text(encoding="utf-8")
+    return f"<style>{css}</style>"
+
+
+st.markdown(load_css(), unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_agent():
+    """Create one TourismAgent per process so its session and caches are shared"""
+    # Imported lazily so reruns don't pay for the agents/requests import chain
+    from agents.parent_agent import TourismAgent
+    return TourismAgent()
+
 
 # Initialize session state
 if 'agent' not in st.session_state:
-    st.session_state.agent = TourismAgent()
+    st.session_state.agent = get_agent()
 
 # Header
 st.markdown('<div class="main-header">✈️ Tourism AI Agent</div>', unsafe_allow_html=True)
@@ -77,11 +48,14 @@ st.markdown('<div class="sub-header">Your intelligent travel companion for weath
 
 # Main input
 st.markdown("### 🗨️ What would you like to know?")
-user_input = st.text_input(
-    "",
-    placeholder="e.g., I'm going to Bangalore, let's plan my trip",
-    label_visibility="collapsed"
-)
+# Use a form so the agents only run on submit, not on every input change
+with st.form("query"):
+    user_input = st.text_input(
+        "",
+        placeholder="e.g., I'm going to Bangalore, let's plan my trip",
+        label_visibility="collapsed"
+    )
+    submitted = st.form_submit_button("Search")
 
 # Example queries
 with st.expander("💡 See example queries"):
@@ -93,7 +67,7 @@ with st.expander("💡 See example queries"):
     """)
 
 # Process query
-if user_input and len(user_input.strip()) > 0:
+if submitted and user_input.strip():
     with st.spinner('🔍 Processing your request...'):
         results = st.session_state.agent.process_query(user_input)
     
@@ -111,6 +85,9 @@ if user_input and len(user_input.strip()) > 0:
         
         # Display weather information
         if results['weather']:
+            from agents.weather_agent import WeatherAgent
+            from utils.api_helpers import format_temperature, format_percentage
+            
             with col1:
                 st.markdown('<div class="weather-card">', unsafe_allow_html=True)
                 st.markdown("### 🌤️ Weather Information")
@@ -147,7 +124,12 @@ if user_input and len(user_input.strip()) > 0:
                 # 3-day forecast
                 st.markdown("#### 3-Day Forecast")
                 
-                for i in range(min(3, len(forecast['dates']))):
+                forecast_days = min(3, len(forecast['dates']))
+                forecast_descs = WeatherAgent.get_weather_descriptions(
+                    forecast['weather_codes'][:forecast_days]
+                )
+                
+                for i in range(forecast_days):
                     date = forecast['dates'][i]
                     max_temp = forecast['max_temps'][i]
                     min_temp = forecast['min_temps'][i]
@@ -158,6 +140,8 @@ if user_input and len(user_input.strip()) > 0:
                         
                         with forecast_col1:
                             st.text(f"📅 {date}")
+                            if i < len(forecast_descs):
+                                st.caption(f"☁️ {forecast_descs[i]}")
                         with forecast_col2:
                             st.text(f"🌡️ {format_temperature(min_temp)} - {format_temperature(max_temp)}")
                         with forecast_col3:
@@ -4,9 +4,66 @@ Shared utilities for making API requests
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, Optional, Any
+import random
 import time
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    import json
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+
+# Shared session so keep-alive connections (and their TLS handshakes) are
+# reused across calls. Retries are handled in make_api_request itself.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# HTTP statuses worth retrying (rate limited or temporary upstream failure)
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+MAX_BACKOFF = 8  # seconds
+
+
+def _backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with jitter for the given retry attempt
+    
+    Args:
+        attempt: Zero-based attempt number
+        
+    Returns:
+        Delay in seconds
+    """
+    return min(MAX_BACKOFF, 0.5 * 2 ** attempt) + random.random() * 0.25
+
+
+def _retry_after_delay(response: requests.Response, attempt: int) -> float:
+    """
+    Delay requested by the server's Retry-After header, if any
+    
+    Args:
+        response: Failed HTTP response
+        attempt: Zero-based attempt number
+        
+    Returns:
+        Delay in seconds (capped at MAX_BACKOFF so the UI isn't blocked),
+        falling back to exponential backoff
+    """
+    retry_after = response.headers.get('Retry-After')
+    if retry_after is not None:
+        try:
+            return min(MAX_BACKOFF, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; use our own backoff instead
+    return _backoff_delay(attempt)
+
 
 def make_api_request(url: str, params: Optional[Dict] = None, 
                     headers: Optional[Dict] = None, 
@@ -39,14 +96,14 @@ def make_api_request(url: str, params: Optional[Dict] = None,
     for attempt in range(max_retries):
         try:
             if method.upper() == 'GET':
-                response = requests.get(
+                response = _SESSION.get(
                     url,
                     params=params,
                     headers=headers,
                     timeout=timeout
                 )
             elif method.upper() == 'POST':
-                response = requests.post(
+                response = _SESSION.post(
                     url,
                     params=params,
                     data=data,
@@ -62,13 +119,13 @@ def make_api_request(url: str, params: Optional[Dict] = None,
             # Check if request was successful
             response.raise_for_status()
             
-            # Try to parse JSON response
+            # Try to parse JSON response straight from the raw bytes
             try:
                 return {
                     'success': True,
-                    'data': response.json()
+                    'data': _json_loads(response.content)
                 }
-            except ValueError:
+            except _JSONDecodeError:
                 return {
                     'success': True,
                     'data': response.text
@@ -76,7 +133,7 @@ def make_api_request(url: str, params: Optional[Dict] = None,
                 
         except requests.exceptions.Timeout:
             if attempt < max_retries - 1:
-                time.sleep(1 * (attempt + 1))  # Exponential backoff
+                time.sleep(_backoff_delay(attempt))
                 continue
             return {
                 'success': False,
@@ -85,7 +142,7 @@ def make_api_request(url: str, params: Optional[Dict] = None,
             
         except requests.exceptions.ConnectionError:
             if attempt < max_retries - 1:
-                time.sleep(1 * (attempt + 1))
+                time.sleep(_backoff_delay(attempt))
                 continue
             return {
                 'success': False,
@@ -93,6 +150,9 @@ def make_api_request(url: str, params: Optional[Dict] = None,
             }
             
         except requests.exceptions.HTTPError as e:
+            if e.response.status_code in RETRYABLE_STATUS_CODES and attempt < max_retries - 1:
+                time.sleep(_retry_after_delay(e.response, attempt))
+                continue
             return {
                 'success': False,
                 'error': f'HTTP error occurred: {e.response.status_code}'